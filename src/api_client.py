@@ -2,42 +2,128 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import time
-from dataclasses import dataclass
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace as dataclass_replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from sys import intern
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
 
-import requests
-from dateutil import parser as date_parser
-from requests import Response, Session
-from requests.exceptions import RequestException
+from .fileio import atomic_write, loads, orjson
+from .models import _parse_iso_datetime
+
+# ``requests`` (with urllib3) and ``dateutil`` are imported where they are first
+# needed so importing this module stays cheap for callers that only normalise
+# already-downloaded events.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from requests import Response, Session
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
 
 DEFAULT_CALENDAR_URL = "https://nfs.faireconomy.media/ff_calendar_thisweek.json"
 DEFAULT_TIMEOUT = 15
 DEFAULT_RETRIES = 3
 DEFAULT_BACKOFF_SECONDS = 2.0
 CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "latest_calendar.json"
-EXPECTED_MINIMUM_KEYS = {"country", "date", "impact", "title"}
+NOT_MODIFIED = 304
+STREAM_BUFFER_SIZE = 65536
+EXPECTED_MINIMUM_KEYS = frozenset({"country", "date", "impact", "title"})
+INTERNED_KEYS = ("country", "impact")
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+FETCH_MANY_WORKERS = 4
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_SESSION: Session | None = None
+
+
+def _build_session(retries: int, backoff_seconds: float) -> Session:
+    """Return a keep-alive session whose adapter retries failed GETs.
+
+    ``retries`` counts total attempts, so the adapter is allowed ``retries - 1``
+    retries after the initial request.
+    """
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry, make_headers
+
+    retry = Retry(
+        total=retries - 1,
+        backoff_factor=backoff_seconds,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Advertise every encoding urllib3 can decode here (br/zstd only when the
+    # optional decoders are installed) so the feed arrives compressed.
+    session.headers.update(make_headers(keep_alive=True, accept_encoding=True))
+    return session
+
+
+def _get_default_session() -> Session:
+    """Return the shared keep-alive session used by clients without their own."""
+
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        _DEFAULT_SESSION = _build_session(DEFAULT_RETRIES, DEFAULT_BACKOFF_SECONDS)
+    return _DEFAULT_SESSION
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 class CalendarAPIError(RuntimeError):
     """Raised when the calendar feed cannot be downloaded or parsed."""
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True, weakref_slot=True)
 class CalendarFetchResult:
-    """Container describing the outcome of a calendar fetch."""
+    """Container describing the outcome of a calendar fetch.
+
+    Results are immutable so a single instance can be shared between clients;
+    use :meth:`replace` to derive a modified copy.
+    """
 
     events: list[dict[str, Any]]
     from_cache: bool
     source: str
     fetched_at: Optional[datetime]
 
+    def replace(self, **changes: Any) -> "CalendarFetchResult":
+        """Return a copy of this result with ``changes`` applied."""
+
+        return dataclass_replace(self, **changes)
+
+
+# Validated cache payloads keyed by (cache path, mtime_ns). Entries live only as
+# long as some client still holds the result, so clients reading the same file
+# share one instance without the registry pinning memory.
+_CACHE_RESULTS: "weakref.WeakValueDictionary[tuple[str, int], CalendarFetchResult]" = (
+    weakref.WeakValueDictionary()
+)
+
 
 class CalendarClient:
     """Download helper with retry logic and on-disk caching for calendar data."""
@@ -57,12 +143,35 @@ class CalendarClient:
         if timeout <= 0:
             raise ValueError("timeout must be > 0")
 
+        self._owns_session = False
+        # Sessions built here retry transport failures in their adapter; an
+        # injected session gets the same retries from the loop in fetch().
+        self._adapter_retries = session is None
+        if session is None:
+            if (retries, backoff_seconds) == (DEFAULT_RETRIES, DEFAULT_BACKOFF_SECONDS):
+                session = _get_default_session()
+            else:
+                session = _build_session(retries, backoff_seconds)
+                self._owns_session = True
+
         self.base_url = base_url
         self.cache_path = cache_path or CACHE_PATH
-        self.session = session or requests.Session()
+        self.meta_path = self.cache_path.with_suffix(".meta.json")
+        self.session = session
         self.timeout = timeout
         self.retries = retries
         self.backoff_seconds = backoff_seconds
+        self._cache_memo: tuple[int, CalendarFetchResult] | None = None
+
+    def close(self) -> None:
+        """Release pooled connections held by a session this client created.
+
+        Injected sessions and the shared default session are left open for
+        their other users.
+        """
+
+        if self._owns_session:
+            self.session.close()
 
     def fetch(  # noqa: D401 - short docstring for clarity
         self,
@@ -72,27 +181,52 @@ class CalendarClient:
     ) -> CalendarFetchResult:
         """Fetch events from the API, falling back to the cached payload when needed."""
 
-        last_error: Optional[Exception] = None
+        from requests.exceptions import RequestException
 
+        last_error: Optional[Exception] = None
         for attempt in range(1, self.retries + 1):
             try:
-                events = self._download()
+                events, validators = self._download()
+                if events is None:
+                    cached = self.load_cache()
+                    if cached is not None:
+                        logger.info(
+                            "Calendar feed not modified; reusing %s", self.cache_path
+                        )
+                        if persist_cache and validators:
+                            self._write_meta(validators)
+                        # The feed was just confirmed current, so report it as
+                        # fetched now rather than at the cache file's mtime.
+                        return cached.replace(
+                            source=self.base_url,
+                            fetched_at=datetime.now(timezone.utc),
+                        )
+                    events, validators = self._download(conditional=False)
+            except (CalendarAPIError, RequestException) as exc:
+                last_error = exc
+                logger.warning(
+                    "Calendar fetch attempt %s/%s failed: %s", attempt, self.retries, exc
+                )
+                # Transport errors were already retried by our own adapter, so
+                # only a bad payload is worth another request there.
+                transport = isinstance(exc, RequestException) or isinstance(
+                    exc.__cause__, RequestException
+                )
+                if transport and self._adapter_retries:
+                    break
+                wait_time = self.backoff_seconds * attempt
+                if attempt < self.retries and wait_time > 0:
+                    time.sleep(wait_time)
+            else:
                 if persist_cache:
                     self._write_cache(events)
+                    self._write_meta(validators)
                 return CalendarFetchResult(
                     events=events,
                     from_cache=False,
                     source=self.base_url,
                     fetched_at=datetime.now(timezone.utc),
                 )
-            except (CalendarAPIError, RequestException) as exc:
-                last_error = exc
-                wait_time = self.backoff_seconds * attempt
-                logger.warning(
-                    "Calendar fetch attempt %s/%s failed: %s", attempt, self.retries, exc
-                )
-                if attempt < self.retries and wait_time > 0:
-                    time.sleep(wait_time)
 
         if use_cache_on_fail:
             cached = self.load_cache()
@@ -103,21 +237,128 @@ class CalendarClient:
         message = "Failed to download calendar feed and no cached data was available"
         raise CalendarAPIError(message) from last_error
 
-    def _download(self) -> list[dict[str, Any]]:
-        response = self.session.get(self.base_url, timeout=self.timeout)
-        self._raise_for_status(response)
-        payload = self._parse_json(response)
-        return self._validate_events(payload)
+    def fetch_many(self, urls: Iterable[str]) -> list[CalendarFetchResult]:
+        """Download several calendar feeds concurrently over the pooled session.
+
+        Results are returned in the order of ``urls``. Unlike :meth:`fetch`, the
+        on-disk cache is neither read nor written.
+        """
+
+        url_list = list(urls)
+        if not url_list:
+            return []
+        workers = min(FETCH_MANY_WORKERS, len(url_list))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._fetch_url, url_list))
+
+    def _fetch_url(self, url: str) -> CalendarFetchResult:
+        from requests.exceptions import RequestException
+
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            self._raise_for_status(response)
+            events = self._validate_events(self._parse_json(response.content))
+        except RequestException as exc:
+            raise CalendarAPIError(f"Calendar request to {url} failed: {exc}") from exc
+        return CalendarFetchResult(
+            events=events,
+            from_cache=False,
+            source=url,
+            fetched_at=datetime.now(timezone.utc),
+        )
+
+    def _download(
+        self, *, conditional: bool = True
+    ) -> tuple[Optional[list[dict[str, Any]]], dict[str, str]]:
+        """Return validated events and cache validators for the feed.
+
+        Events are ``None`` when the cached payload is still current: either the
+        server answered ``304 Not Modified`` or the body hashes to the digest
+        recorded for the cache.
+        """
+
+        meta = self._read_meta() if conditional and self.cache_path.exists() else {}
+        # Closing the streamed response returns its connection to the pool,
+        # including on the 304 and error paths that never read the body.
+        with self.session.get(
+            self.base_url,
+            timeout=self.timeout,
+            stream=True,
+            headers=self._conditional_headers(meta),
+        ) as response:
+            if response.status_code == NOT_MODIFIED:
+                return None, {}
+            self._raise_for_status(response)
+            digest, load_payload = self._read_body(response)
+            validators = {
+                key: value
+                for key, value in (
+                    ("etag", response.headers.get("ETag")),
+                    ("last_modified", response.headers.get("Last-Modified")),
+                    ("sha256", digest),
+                )
+                if value
+            }
+
+        # An unchanged body stops here, before any per-event validation.
+        if meta.get("sha256") == digest:
+            return None, validators
+        return self._validate_events(load_payload()), validators
+
+    def _read_body(self, response: Response) -> tuple[str, Callable[[], Any]]:
+        """Hash the streamed body and return its digest with a payload loader.
+
+        With ijson each chunk is hashed and fed to an incremental parser, so
+        events are decoded while the download is still in progress. Without it
+        the raw chunks are kept and only parsed if the loader is called.
+        """
+
+        hasher = hashlib.sha256()
+        chunks = response.iter_content(STREAM_BUFFER_SIZE)
+        if ijson is None:
+            body: list[bytes] = []
+            for chunk in chunks:
+                hasher.update(chunk)
+                body.append(chunk)
+            return hasher.hexdigest(), lambda: self._parse_json(b"".join(body))
+
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "item", use_float=True)
+        leading = b""
+        try:
+            for chunk in chunks:
+                hasher.update(chunk)
+                if not leading:
+                    leading = chunk.lstrip()[:1]
+                    if leading and leading != b"[":
+                        raise CalendarAPIError(
+                            "Expected top-level JSON array from calendar feed"
+                        )
+                parser.send(chunk)
+            parser.close()
+        except ijson.JSONError as exc:
+            raise CalendarAPIError("Received invalid JSON from calendar feed") from exc
+        return hasher.hexdigest(), lambda: items
+
+    def _conditional_headers(self, meta: dict[str, str]) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
 
     def _raise_for_status(self, response: Response) -> None:
+        from requests.exceptions import RequestException
+
         try:
             response.raise_for_status()
         except RequestException as exc:  # pragma: no cover - thin wrapper
             raise CalendarAPIError(f"Calendar request failed: {exc}") from exc
 
-    def _parse_json(self, response: Response) -> Any:
+    def _parse_json(self, body: bytes) -> Any:
         try:
-            return response.json()
+            return loads(body)
         except ValueError as exc:
             raise CalendarAPIError("Received invalid JSON from calendar feed") from exc
 
@@ -125,65 +366,95 @@ class CalendarClient:
         if not isinstance(payload, list):
             raise CalendarAPIError("Expected top-level JSON array from calendar feed")
 
-        validated: list[dict[str, Any]] = []
-        for index, item in enumerate(payload):
-            if not isinstance(item, dict):
-                raise CalendarAPIError(
-                    f"Calendar event at index {index} is not an object: {type(item)!r}"
-                )
-            missing = EXPECTED_MINIMUM_KEYS - item.keys()
-            if missing:
-                raise CalendarAPIError(
-                    "Calendar event missing required fields: "
-                    + ", ".join(sorted(missing))
-                )
-
-            date_value = item.get("date")
-            if not isinstance(date_value, str):
-                raise CalendarAPIError("Calendar event date must be an ISO 8601 string")
-            try:
-                # Validate the timestamp is parseable without storing the datetime yet.
-                date_parser.isoparse(date_value)
-            except (TypeError, ValueError) as exc:
-                raise CalendarAPIError(
-                    f"Invalid calendar event date value: {date_value!r}"
-                ) from exc
+        validate = self._validate_event
+        return [validate(index, item) for index, item in enumerate(payload)]
 
-            validated.append(dict(item))
+    def _validate_event(self, index: int, item: Any) -> dict[str, Any]:
+        if not isinstance(item, dict):
+            raise CalendarAPIError(
+                f"Calendar event at index {index} is not an object: {type(item)!r}"
+            )
+        if not EXPECTED_MINIMUM_KEYS.issubset(item):
+            missing = EXPECTED_MINIMUM_KEYS - item.keys()
+            raise CalendarAPIError(
+                "Calendar event missing required fields: "
+                + ", ".join(sorted(missing))
+            )
 
-        return validated
+        date_value = item.get("date")
+        if not isinstance(date_value, str):
+            raise CalendarAPIError("Calendar event date must be an ISO 8601 string")
+        try:
+            # Validate the timestamp is parseable without storing the datetime yet.
+            _parse_iso_datetime(date_value)
+        except (TypeError, ValueError) as exc:
+            raise CalendarAPIError(
+                f"Invalid calendar event date value: {date_value!r}"
+            ) from exc
+
+        # Currency and impact values repeat across hundreds of events; share one
+        # string object per distinct value.
+        for key in INTERNED_KEYS:
+            value = item[key]
+            if type(value) is str:
+                item[key] = intern(value)
+
+        # Payloads are freshly decoded and owned by the client, so no copy is needed.
+        return item
 
     def _write_cache(self, events: Iterable[dict[str, Any]]) -> None:
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        serialized = json.dumps(list(events), ensure_ascii=False, indent=2)
-        self.cache_path.write_text(serialized, encoding="utf-8")
+        atomic_write(self.cache_path, _dumps(list(events)))
+
+    def _read_meta(self) -> dict[str, str]:
+        try:
+            meta = loads(self.meta_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return meta if isinstance(meta, dict) else {}
+
+    def _write_meta(self, validators: dict[str, str]) -> None:
+        if not validators:
+            self.meta_path.unlink(missing_ok=True)
+            return
+        try:
+            atomic_write(self.meta_path, _dumps(validators))
+        except OSError as exc:
+            logger.warning("Failed to write calendar cache metadata: %s", exc)
 
     def load_cache(self) -> Optional[CalendarFetchResult]:
-        if not self.cache_path.exists():
+        try:
+            stat = self.cache_path.stat()
+        except OSError:
             return None
 
+        # Reuse the validated payload until the file is rewritten.
+        memo = self._cache_memo
+        if memo is not None and memo[0] == stat.st_mtime_ns:
+            return memo[1]
+
+        shared_key = (str(self.cache_path), stat.st_mtime_ns)
+        shared = _CACHE_RESULTS.get(shared_key)
+        if shared is not None:
+            self._cache_memo = (stat.st_mtime_ns, shared)
+            return shared
+
         try:
-            raw = self.cache_path.read_text(encoding="utf-8")
-            payload = json.loads(raw)
+            payload = loads(self.cache_path.read_bytes())
             events = self._validate_events(payload)
         except (OSError, ValueError, CalendarAPIError) as exc:
             logger.warning("Failed to read cached calendar data: %s", exc)
             return None
 
-        fetched_at = self._cache_timestamp()
-        return CalendarFetchResult(
+        result = CalendarFetchResult(
             events=events,
             from_cache=True,
             source=str(self.cache_path),
-            fetched_at=fetched_at,
+            fetched_at=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
         )
-
-    def _cache_timestamp(self) -> Optional[datetime]:
-        try:
-            stat = self.cache_path.stat()
-        except OSError:
-            return None
-        return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        self._cache_memo = (stat.st_mtime_ns, result)
+        _CACHE_RESULTS[shared_key] = result
+        return result
 
 
 def normalize_event_datetimes(
@@ -202,16 +473,30 @@ def normalize_event_datetimes(
     """
 
     normalized: list[dict[str, Any]] = []
+    # Many events share a release time, so convert each distinct timestamp once
+    # and hand the same (immutable) datetime objects to every matching event.
+    conversions: dict[str, tuple[datetime, Optional[datetime]]] = {}
+    utc = timezone.utc
     for event in events:
         date_value = event.get("date")
         if not isinstance(date_value, str):
             raise CalendarAPIError("Cannot normalize event without a date string")
 
-        parsed = date_parser.isoparse(date_value)
+        converted = conversions.get(date_value)
+        if converted is None:
+            parsed = _parse_iso_datetime(date_value)
+            converted = (
+                parsed.astimezone(utc),
+                # Resolved per timestamp rather than from one snapshot tzinfo so
+                # events on either side of a DST change get the right offset.
+                parsed.astimezone() if include_local else None,
+            )
+            conversions[date_value] = converted
+
         event_copy = dict(event)
-        event_copy["datetime_utc"] = parsed.astimezone(timezone.utc)
+        event_copy["datetime_utc"] = converted[0]
         if include_local:
-            event_copy["datetime_local"] = parsed.astimezone()
+            event_copy["datetime_local"] = converted[1]
         normalized.append(event_copy)
 
     return normalized
@@ -220,7 +505,7 @@ def normalize_event_datetimes(
 def load_default_client() -> CalendarClient:
     """Convenience helper returning a client with default configuration."""
 
-    return CalendarClient()
+    return CalendarClient(session=_get_default_session())
 
 
 __all__ = [
@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 
-import platform
+import queue
 import threading
+import time
 import tkinter as tk
-from datetime import date, datetime, timedelta
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import date, datetime
 from pathlib import Path
-from tkinter import filedialog, ttk
-from typing import Iterable, Sequence
+from tkinter import ttk
+from typing import Callable, Iterable, Sequence
+
+try:
+    import winsound
+except ImportError:  # pragma: no cover - only available on Windows
+    winsound = None
 
 from ttkbootstrap import Window
-from ttkbootstrap.constants import BOTH, END, LEFT, RIGHT, X
+from ttkbootstrap.constants import BOTH, LEFT, RIGHT, X
 from ttkbootstrap.dialogs import Messagebox
 from ttkbootstrap.widgets import Button, Checkbutton, Entry, Frame, Label
 
@@ -33,12 +44,12 @@ from .config import (
 from .logging_setup import configure_logging
 from .models import (
     CalendarEvent,
+    EventIndex,
     ImpactLevel,
+    build_event_index,
     build_events,
-    filter_by_currency,
-    filter_by_date_range,
-    filter_by_impact,
-    search_events,
+    search_event_indexes,
+    select_event_indexes,
     sort_events,
 )
 
@@ -62,10 +73,44 @@ DEFAULT_IMPACT_ORDER = (
 )
 DEFAULT_AUTO_REFRESH_MINUTES = 30
 AUTO_REFRESH_CHOICES = ("15", "30", "45", "60")
+# Quiet refreshes stretch the interval up to this multiple of the chosen one.
+AUTO_REFRESH_MAX_BACKOFF = 8
+FILTER_DEBOUNCE_MS = 180
+TREE_ROW_HEIGHT = 28
+# Above this many visible events only a scrolled window of rows is kept in the tree.
+VIRTUAL_ROW_THRESHOLD = 500
+VIRTUAL_OVERSCAN_ROWS = 5
+TREE_SYNC_CHUNK = 200
+PREFERENCES_SAVE_DELAY_MS = 500
+TOAST_DURATION_MS = 3000
+STATUS_FORMAT = "%s - %d event%s visible"
+
+IMPACT_ROW_TAGS = {
+    ImpactLevel.HIGH: ("impact-high",),
+    ImpactLevel.MEDIUM: ("impact-medium",),
+    ImpactLevel.LOW: ("impact-low",),
+}
+ROW_STATE_TAGS = ((), ("event-new",), ("event-updated",))
+# Every tag combination a row can carry, keyed by (impact, odd row, state index).
+ROW_TAGS: dict[tuple[ImpactLevel, int, int], tuple[str, ...]] = {
+    (impact, odd, state): IMPACT_ROW_TAGS.get(impact, ())
+    + (("odd-row",) if odd else ())
+    + ROW_STATE_TAGS[state]
+    for impact in ImpactLevel
+    for odd in (0, 1)
+    for state in range(len(ROW_STATE_TAGS))
+}
 
 
 configure_logging()
 
+
+@lru_cache(maxsize=64)
+def _parse_currency_list(raw: str) -> tuple[str, ...]:
+    tokens = (token.strip().upper() for token in raw.split(","))
+    return tuple(token for token in tokens if token)
+
+
 class ForexNewsApp(Window):
     """Main application window."""
 
@@ -82,10 +127,24 @@ class ForexNewsApp(Window):
 
         preferences.api_url = None
         self.client = CalendarClient(base_url=DEFAULT_CALENDAR_URL)
-        self._fetch_thread: threading.Thread | None = None
+        # A single long-lived worker runs cache loads and fetches in order; the
+        # busy flag is only touched on the Tk thread.
+        self._fetch_busy = False
+        self._closing = threading.Event()
+        self._background_jobs: queue.SimpleQueue[Callable[[], None] | None] = (
+            queue.SimpleQueue()
+        )
+        self._background_worker = threading.Thread(
+            target=self._run_background_jobs, name="calendar-worker", daemon=True
+        )
+        self._background_worker.start()
 
         self.all_events: list[CalendarEvent] = []
         self.filtered_events: list[CalendarEvent] = []
+        self._event_index = build_event_index(())
+        self._last_search: tuple[str, list[int]] | None = None
+        self._data_version = 0
+        self._last_filter_key: tuple[object, ...] | None = None
         self.latest_event_date: date | None = None
         self.last_fetch_source: str | None = None
         self.last_fetch_timestamp: datetime | None = None
@@ -107,13 +166,37 @@ class ForexNewsApp(Window):
         self.auto_refresh_interval_var = tk.StringVar(
             value=str(DEFAULT_AUTO_REFRESH_MINUTES)
         )
+        # Parsed interval, cleared whenever the combobox text changes.
+        self._auto_refresh_minutes: int | None = None
+        self.auto_refresh_interval_var.trace_add(
+            "write", self._invalidate_auto_refresh_minutes
+        )
         self.status_var = tk.StringVar(value="Ready")
+        self._mirror_filter_vars()
         self.last_updated_var = tk.StringVar(
             value="Last updated: waiting for data (no cache loaded)"
         )
 
         self._tree_event_map: dict[str, CalendarEvent] = {}
+        self._tree_item_by_uid: dict[str, str] = {}
+        self._tree_row_cache: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self._tree_order: list[str] = []
+        self._virtual_rows = False
+        self._view_start = 0
+        self._tree_sync_job: str | None = None
         self._auto_refresh_job: str | None = None
+        self._toast_job: str | None = None
+        self._unchanged_refreshes = 0
+        self._auto_refresh_in_flight = False
+        self._save_job: str | None = None
+        self._saved_preferences: AppPreferences | None = None
+        self._preferences_lock = threading.Lock()
+        # Preference writes get their own thread so they never queue behind a
+        # slow fetch on the calendar worker.
+        self._preferences_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="preferences"
+        )
+        self._filter_job: str | None = None
         self.export_directory: Path | None = None
         self._error_prompt: tk.Toplevel | None = None
 
@@ -127,6 +210,11 @@ class ForexNewsApp(Window):
         self._apply_preferences(preferences)
         self._applying_preferences = False
 
+        # Typing in the text filters and toggling impacts re-filter once the user
+        # pauses; <Return> still applies immediately.
+        self.currency_var.trace_add("write", self._schedule_filter)
+        self.search_var.trace_add("write", self._schedule_filter)
+
         self.protocol("WM_DELETE_WINDOW", self._on_exit)
         self._load_cache_on_startup()
 
@@ -135,7 +223,7 @@ class ForexNewsApp(Window):
         text_color = "#ffffff"
         base.configure(
             "Treeview",
-            rowheight=28,
+            rowheight=TREE_ROW_HEIGHT,
             font=("Segoe UI", 11, "bold"),
             foreground=text_color,
             background=self.colors.dark,
@@ -203,7 +291,7 @@ class ForexNewsApp(Window):
                 text=impact.value,
                 variable=self.impact_filters[impact],
                 bootstyle="toolbutton",
-                command=self.apply_filters,
+                command=self._schedule_filter,
             ).pack(side=LEFT, padx=2)
 
         Button(
@@ -324,30 +412,22 @@ class ForexNewsApp(Window):
                 stretch=True,
             )
 
-        self.tree.tag_configure(
-            "impact-high", background=self.colors.danger, foreground="#ffffff"
-        )
-        self.tree.tag_configure(
-            "impact-medium",
-            background=self.colors.warning,
-            foreground="#ffffff",
-        )
-        self.tree.tag_configure(
-            "impact-low", background=self.colors.info, foreground="#ffffff"
-        )
-        self.tree.tag_configure(
-            "odd-row", background=self.colors.secondary, foreground="#ffffff"
-        )
-        self.tree.tag_configure(
-            "event-new", background=self.colors.success, foreground=self.colors.light
-        )
-        self.tree.tag_configure(
-            "event-updated", background=self.colors.primary, foreground=self.colors.light
+        colors = self.colors
+        tag_styles = (
+            ("impact-high", colors.danger, "#ffffff"),
+            ("impact-medium", colors.warning, "#ffffff"),
+            ("impact-low", colors.info, "#ffffff"),
+            ("odd-row", colors.secondary, "#ffffff"),
+            ("event-new", colors.success, colors.light),
+            ("event-updated", colors.primary, colors.light),
         )
+        for tag, background, foreground in tag_styles:
+            self.tree.tag_configure(tag, background=background, foreground=foreground)
 
-        y_scroll = ttk.Scrollbar(parent, orient="vertical", command=self.tree.yview)
+        y_scroll = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
         x_scroll = ttk.Scrollbar(parent, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=x_scroll.set)
+        self._y_scroll = y_scroll
 
         self.tree.grid(row=0, column=0, sticky="nsew")
         y_scroll.grid(row=0, column=1, sticky="ns")
@@ -357,12 +437,18 @@ class ForexNewsApp(Window):
         parent.grid_columnconfigure(0, weight=1)
 
         self.tree.bind("<Double-1>", self._on_tree_double_click)
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_tree_wheel)
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(sequence, self._on_tree_key)
         self.after(200, self._auto_size_tree_columns)
 
     def _build_footer(self, parent: Frame) -> None:
         Label(parent, textvariable=self.status_var, anchor="w").pack(fill=X)
         Label(parent, textvariable=self.last_updated_var, anchor="w").pack(fill=X)
         self.progress = ttk.Progressbar(parent, mode="indeterminate")
+        self._toast_label = Label(parent, anchor="w", bootstyle="success")
 
     def _auto_size_tree_columns(self) -> None:
         if not hasattr(self, "tree") or not hasattr(self, "_base_tree_column_widths"):
@@ -397,6 +483,20 @@ class ForexNewsApp(Window):
                 self.progress.stop()
                 self.progress.pack_forget()
 
+    def _show_toast(self, message: str, duration_ms: int = TOAST_DURATION_MS) -> None:
+        """Show ``message`` in the footer and hide it again without blocking."""
+
+        if self._toast_job is not None:
+            self.after_cancel(self._toast_job)
+        self._toast_label.configure(text=message)
+        if not self._toast_label.winfo_manager():
+            self._toast_label.pack(fill=X, pady=(4, 0))
+        self._toast_job = self.after(duration_ms, self._hide_toast)
+
+    def _hide_toast(self) -> None:
+        self._toast_job = None
+        self._toast_label.pack_forget()
+
     def _apply_preferences(self, prefs: AppPreferences) -> None:
         try:
             self.geometry(f"{prefs.window_width}x{prefs.window_height}")
@@ -432,7 +532,7 @@ class ForexNewsApp(Window):
         impacts = [impact.value for impact, var in self.impact_filters.items() if var.get()]
         if not impacts:
             impacts = [ImpactLevel.HIGH.value]
-        currencies = self._parse_currencies(self.currency_var.get())
+        currencies = list(self._parse_currencies(self.currency_var.get()))
         alerts = self.alert_manager.get_preferences()
         return AppPreferences(
             window_width=width,
@@ -450,16 +550,106 @@ class ForexNewsApp(Window):
         )
 
     def save_preferences(self) -> None:
+        """Write preferences once a burst of changes settles."""
+
         if getattr(self, "_applying_preferences", False):
             return
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(
+            PREFERENCES_SAVE_DELAY_MS, lambda: self._save_preferences_now(background=True)
+        )
+
+    def _save_preferences_now(self, *, background: bool = False) -> None:
+        """Collect preferences on the Tk thread and write them if they changed.
+
+        With ``background`` the file write is handed to the preferences writer.
+        """
+
+        if self._save_job is not None:
+            self.after_cancel(self._save_job)
+            self._save_job = None
         try:
             prefs = self._collect_preferences()
-            self.config_manager.save(prefs)
         except Exception:
-            pass
+            return
+        if prefs == self._saved_preferences:
+            return
+        if background:
+            self._preferences_writer.submit(self._write_preferences, prefs)
+        else:
+            self._write_preferences(prefs)
+
+    def _write_preferences(self, prefs: AppPreferences) -> None:
+        with self._preferences_lock:
+            # Only a completed write counts as saved, so a write still pending
+            # at exit is redone rather than skipped.
+            if prefs == self._saved_preferences:
+                return
+            try:
+                self.config_manager.save(prefs)
+            except Exception:
+                logging.exception("Failed to save preferences")
+                return
+            self._saved_preferences = prefs
 
     def _load_cache_on_startup(self) -> None:
-        cached = self.client.load_cache()
+        # Read and parse the cache off the Tk thread so the window paints
+        # immediately. Marking the worker busy keeps refresh_data from racing it.
+        self.status_var.set("Loading cached calendar...")
+        self._submit_background(self._load_cache_worker)
+
+    def _submit_background(self, job: Callable[[], None]) -> None:
+        self._fetch_busy = True
+        self._background_jobs.put(job)
+
+    def _run_background_jobs(self) -> None:
+        while True:
+            job = self._background_jobs.get()
+            if job is None or self._closing.is_set():
+                return
+            try:
+                job()
+            except Exception:
+                logging.exception("Background job failed")
+                self._post_to_ui(self._handle_background_failure)
+
+    def _post_to_ui(self, callback: Callable[[], None]) -> None:
+        """Hand ``callback`` to the Tk thread unless the window is shutting down."""
+
+        if self._closing.is_set():
+            return
+        try:
+            self.after(0, callback)
+        except (RuntimeError, tk.TclError):
+            # The window was destroyed between the check and the call.
+            pass
+
+    def _handle_background_failure(self) -> None:
+        self._fetch_busy = False
+        self._show_spinner(False)
+        self.status_var.set("Failed to refresh data")
+        self._finish_auto_refresh(changed=None)
+
+    def _load_cache_worker(self) -> None:
+        try:
+            cached = self.client.load_cache()
+        except Exception as exc:
+            logging.error("Unable to load cached calendar: %s", exc)
+            cached = None
+        events: list[CalendarEvent] = []
+        if cached:
+            events = sort_events(build_events(cached.events), by_impact_first=False)
+        index = build_event_index(events)
+        self._post_to_ui(lambda: self._apply_loaded_cache(events, cached, index))
+
+    def _apply_loaded_cache(
+        self,
+        events: list[CalendarEvent],
+        cached: CalendarFetchResult | None,
+        index: EventIndex | None = None,
+    ) -> None:
+        self._fetch_busy = False
         if not cached:
             self.status_var.set("No cached data found; fetching latest calendar...")
             self.last_updated_var.set(
@@ -468,7 +658,6 @@ class ForexNewsApp(Window):
             self.after(200, lambda: self.refresh_data(force=True))
             return
 
-        events = sort_events(build_events(cached.events), by_impact_first=False)
         if not events:
             self.status_var.set("Cached data empty; fetching latest calendar...")
             self.last_updated_var.set(
@@ -478,6 +667,7 @@ class ForexNewsApp(Window):
             return
 
         self.all_events = events
+        self._index_events(events, index)
         self.latest_event_date = self._latest_event_date(events)
         self.previous_events_by_uid = {event.uid: event for event in events}
         self._new_event_uids.clear()
@@ -499,7 +689,7 @@ class ForexNewsApp(Window):
             self.after(200, lambda: self.refresh_data(force=True))
 
     def refresh_data(self, force: bool = False) -> None:
-        if self._fetch_thread and self._fetch_thread.is_alive():
+        if self._fetch_busy:
             return
 
         if (
@@ -512,38 +702,62 @@ class ForexNewsApp(Window):
 
         self._show_spinner(True)
         self.status_var.set("Refreshing data...")
-        self._fetch_thread = threading.Thread(target=self._fetch_data, daemon=True)
-        self._fetch_thread.start()
+        self._submit_background(self._fetch_data)
 
     def _fetch_data(self) -> None:
         try:
             result = self.client.fetch()
         except CalendarAPIError as exc:
-            self.after(0, lambda: self._handle_error(str(exc)))
+            self._post_to_ui(lambda: self._handle_error(str(exc)))
             return
 
-        events = build_events(result.events)
-        self.after(0, lambda: self._handle_fetch_success(events, result))
+        # Build, sort and index here so the Tk thread only swaps in the result.
+        events = sort_events(build_events(result.events), by_impact_first=False)
+        index = build_event_index(events)
+        self._post_to_ui(lambda: self._handle_fetch_success(events, result, index))
 
     def _handle_fetch_success(
-        self, events: list[CalendarEvent], fetch_result
+        self,
+        events: list[CalendarEvent],
+        fetch_result,
+        index: EventIndex | None = None,
     ) -> None:
-        self._fetch_thread = None
+        self._fetch_busy = False
         self._show_spinner(False)
 
+        # One sweep builds the uid map, the new/changed sets and the latest date.
         previous_map = self.previous_events_by_uid
-        current_map = {event.uid: event for event in events}
+        event_changed = self._event_changed
+        current_map: dict[str, CalendarEvent] = {}
+        new_uids: set[str] = set()
+        changed_uids: set[str] = set()
+        latest: date | None = None
+        for event in events:
+            uid = event.uid
+            current_map[uid] = event
+            event_date = event.datetime_local.date()
+            if latest is None or event_date > latest:
+                latest = event_date
+            previous = previous_map.get(uid)
+            if previous is None:
+                new_uids.add(uid)
+            elif event_changed(previous, event):
+                changed_uids.add(uid)
+            else:
+                changed_uids.discard(uid)
 
-        self._new_event_uids = set(current_map) - set(previous_map)
-        self._changed_event_uids = {
-            uid
-            for uid, event in current_map.items()
-            if uid in previous_map and self._event_changed(previous_map[uid], event)
-        }
+        self._new_event_uids = new_uids
+        self._changed_event_uids = changed_uids
         self.previous_events_by_uid = current_map
+        self.latest_event_date = latest
 
-        self.all_events = sort_events(events, by_impact_first=False)
-        self.latest_event_date = self._latest_event_date(self.all_events)
+        if index is None:
+            # Worker-built indexes come with events already sorted.
+            events = sort_events(events, by_impact_first=False)
+        self.all_events = events
+        self._index_events(events, index)
+        # Arm the next tick only now, so its high-impact cap sees the new events.
+        self._finish_auto_refresh(changed=bool(new_uids or changed_uids))
         self.apply_filters(status_prefix="Fetched latest calendar from API")
         self._update_last_updated(
             source=fetch_result.source,
@@ -554,10 +768,11 @@ class ForexNewsApp(Window):
         self.alert_manager.reload_events(self.all_events)
 
     def _handle_error(self, message: str) -> None:
-        self._fetch_thread = None
+        self._fetch_busy = False
         self._show_spinner(False)
         logging.error("Data refresh failed: %s", message)
         self.status_var.set("Failed to refresh data")
+        self._finish_auto_refresh(changed=None)
         cached_result: CalendarFetchResult | None = None
         try:
             cached_result = self.client.load_cache()
@@ -565,21 +780,89 @@ class ForexNewsApp(Window):
             logging.error("Unable to load cached data after error: %s", exc)
         self._show_error_prompt(message, cached_result)
 
+    def _mirror_filter_vars(self) -> None:
+        """Keep plain copies of the filter inputs so apply_filters skips Tcl reads."""
+
+        flags = {impact: var.get() for impact, var in self.impact_filters.items()}
+        for impact, var in self.impact_filters.items():
+            var.trace_add(
+                "write",
+                lambda *_args, impact=impact, var=var: flags.__setitem__(impact, var.get()),
+            )
+        text: dict[str, str] = {}
+        for name, var in (
+            ("currency", self.currency_var),
+            ("search", self.search_var),
+            ("start", self.start_date_var),
+            ("end", self.end_date_var),
+        ):
+            text[name] = var.get()
+            var.trace_add(
+                "write",
+                lambda *_args, name=name, var=var: text.__setitem__(name, var.get()),
+            )
+        self._impact_flags = flags
+        self._filter_text = text
+
+    def _schedule_filter(self, *_args: object) -> None:
+        self._cancel_scheduled_filter()
+        self._filter_job = self.after(FILTER_DEBOUNCE_MS, self._run_scheduled_filter)
+
+    def _run_scheduled_filter(self) -> None:
+        self._filter_job = None
+        self.apply_filters()
+
+    def _cancel_scheduled_filter(self) -> None:
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+
+    def _index_events(
+        self, events: Sequence[CalendarEvent], index: EventIndex | None = None
+    ) -> None:
+        """Install lookup tables over ``events`` (already sorted) for apply_filters.
+
+        Background loaders pass an ``index`` they built off the Tk thread.
+        """
+
+        if index is None:
+            index = build_event_index(events)
+        self._event_index = index
+        self._data_version += 1
+        self._last_search = None
+
+    def _search_matches(self, query: str) -> list[int]:
+        """Return positions matching ``query``, narrowing from the last search."""
+
+        matches = search_event_indexes(self._event_index, query, self._last_search)
+        self._last_search = (query, matches)
+        return matches
+
     def apply_filters(self, *, status_prefix: str | None = None) -> None:
-        events = list(self.all_events)
+        self._cancel_scheduled_filter()
 
         active_impacts = [
-            impact for impact, var in self.impact_filters.items() if var.get()
+            impact for impact, enabled in self._impact_flags.items() if enabled
         ]
-        if active_impacts and len(active_impacts) < len(self.impact_filters):
-            events = filter_by_impact(events, active_impacts)
-
-        currencies = self._parse_currencies(self.currency_var.get())
-        if currencies:
-            events = filter_by_currency(events, currencies)
+        text = self._filter_text
+        currencies = self._parse_currencies(text["currency"])
+        query = text["search"].strip().lower()
+        start_input = text["start"].strip()
+        end_input = text["end"].strip()
+
+        # Repeated calls with the same inputs and data (e.g. <Return> after the
+        # debounce already ran) leave the tree as it is.
+        filter_key = (
+            frozenset(active_impacts),
+            currencies,
+            query,
+            start_input,
+            end_input,
+            self._data_version,
+        )
+        if filter_key == self._last_filter_key and status_prefix is None:
+            return
 
-        start_input = self.start_date_var.get().strip()
-        end_input = self.end_date_var.get().strip()
         self.start_date_var.set(start_input)
         self.end_date_var.set(end_input)
         try:
@@ -593,56 +876,270 @@ class ForexNewsApp(Window):
             self.status_var.set("Invalid date filter: start date is after end date")
             return
 
-        if start_date or end_date:
-            events = filter_by_date_range(events, start_date, end_date)
-
-        query = self.search_var.get().strip()
-        if query:
-            events = search_events(events, query)
-
-        self.filtered_events = sort_events(events, by_impact_first=False)
+        # Positions index the pre-sorted all_events, so the result keeps
+        # chronological order without re-sorting.
+        positions = select_event_indexes(
+            self._event_index,
+            impacts=(
+                active_impacts
+                if active_impacts and len(active_impacts) < len(self.impact_filters)
+                else None
+            ),
+            currencies=currencies,
+            start=start_date,
+            end=end_date,
+            search_matches=self._search_matches(query) if query else None,
+        )
+        all_events = self.all_events
+        if not isinstance(positions, range):
+            self.filtered_events = [all_events[position] for position in positions]
+        elif len(positions) == len(all_events):
+            # No filter excludes anything; share the list (it is never mutated
+            # in place, only replaced).
+            self.filtered_events = all_events
+        else:
+            self.filtered_events = all_events[positions.start : positions.stop]
         self._populate_tree(self.filtered_events)
+        self._last_filter_key = filter_key
 
         prefix = status_prefix or "Filters applied"
         self.status_var.set(self._format_status(prefix))
         self.save_preferences()
 
-    def _populate_tree(self, events: Iterable[CalendarEvent]) -> None:
-        self.tree.delete(*self.tree.get_children())
-        self._tree_event_map.clear()
-
-        for index, event in enumerate(events):
-            tags: list[str] = []
-            if event.impact is ImpactLevel.HIGH:
-                tags.append("impact-high")
-            elif event.impact is ImpactLevel.MEDIUM:
-                tags.append("impact-medium")
-            elif event.impact is ImpactLevel.LOW:
-                tags.append("impact-low")
-            if index % 2:
-                tags.append("odd-row")
-            if event.uid in self._new_event_uids:
-                tags.append("event-new")
-            elif event.uid in self._changed_event_uids:
-                tags.append("event-updated")
-
-            local_dt = event.datetime_local
-            item_id = self.tree.insert(
-                "",
-                END,
-                values=(
-                    local_dt.strftime("%Y-%m-%d"),
-                    local_dt.strftime("%I:%M %p").lstrip("0"),
-                    event.currency,
-                    event.impact.value,
-                    event.title,
-                    event.actual or "n/a",
-                    event.forecast or "n/a",
-                    event.previous or "n/a",
-                ),
-                tags=tags,
+    def _populate_tree(self, events: Sequence[CalendarEvent]) -> None:
+        """Show ``events`` in the tree.
+
+        Large result sets are virtualized: only the rows around ``_view_start``
+        exist as Tk items, and the scrollbar is driven from the full count.
+        """
+        if len(events) <= VIRTUAL_ROW_THRESHOLD:
+            self._virtual_rows = False
+            self._view_start = 0
+            self._sync_tree_rows(events, 0)
+            return
+
+        self._virtual_rows = True
+        visible = self._visible_row_count()
+        self._view_start = max(0, min(self._view_start, len(events) - visible))
+        window = events[self._view_start : self._view_start + visible + VIRTUAL_OVERSCAN_ROWS]
+        self._sync_tree_rows(window, self._view_start)
+        self.tree.yview_moveto(0)
+        self._update_virtual_scrollbar()
+
+    def _visible_row_count(self) -> int:
+        try:
+            height = self.tree.winfo_height()
+        except Exception:
+            height = 0
+        return max(int(self.tree.cget("height")), height // TREE_ROW_HEIGHT)
+
+    def _scroll_virtual_rows(self, start: int) -> None:
+        limit = max(0, len(self.filtered_events) - self._visible_row_count())
+        start = max(0, min(start, limit))
+        if start != self._view_start:
+            self._view_start = start
+            self._populate_tree(self.filtered_events)
+
+    def _update_virtual_scrollbar(self) -> None:
+        total = len(self.filtered_events)
+        if not total:
+            self._y_scroll.set(0.0, 1.0)
+            return
+        last = min(total, self._view_start + self._visible_row_count())
+        self._y_scroll.set(self._view_start / total, last / total)
+
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        if self._virtual_rows:
+            self._update_virtual_scrollbar()
+        else:
+            self._y_scroll.set(first, last)
+
+    def _on_scrollbar(self, *args: str) -> None:
+        if not self._virtual_rows:
+            self.tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._scroll_virtual_rows(int(float(args[1]) * len(self.filtered_events)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_row_count()
+            self._scroll_virtual_rows(self._view_start + step)
+
+    def _on_tree_wheel(self, event: tk.Event) -> str | None:
+        if not self._virtual_rows:
+            return None
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._scroll_virtual_rows(self._view_start + (-3 if up else 3))
+        return "break"
+
+    def _on_tree_key(self, event: tk.Event) -> str | None:
+        """Move the focused row across the whole result in virtual mode.
+
+        Only the rows around ``_view_start`` exist as Tk items, so the default
+        bindings would stop at the window edge; positions are tracked in
+        ``filtered_events`` terms instead and the window follows the focus.
+        """
+        if not self._virtual_rows or not self.filtered_events:
+            return None
+        total = len(self.filtered_events)
+        visible = self._visible_row_count()
+        order = self._tree_order
+        focus = self.tree.focus()
+        if focus in order:
+            current = self._view_start + order.index(focus)
+        else:
+            current = self._view_start - 1
+
+        key = event.keysym
+        if key == "Home":
+            target = 0
+        elif key == "End":
+            target = total - 1
+        elif key == "Prior":
+            target = current - visible
+        elif key == "Next":
+            target = current + visible
+        elif key == "Up":
+            target = current - 1
+        else:
+            target = current + 1
+        target = max(0, min(target, total - 1))
+
+        if target < self._view_start:
+            self._scroll_virtual_rows(target)
+        elif target >= self._view_start + visible:
+            self._scroll_virtual_rows(target - visible + 1)
+
+        # Scrolling may have rebuilt the item order list.
+        order = self._tree_order
+        position = target - self._view_start
+        if 0 <= position < len(order):
+            item_id = order[position]
+            self.tree.focus(item_id)
+            self.tree.selection_set(item_id)
+            self.tree.see(item_id)
+        return "break"
+
+    def _on_tree_configure(self, _event: object) -> None:
+        if self._virtual_rows:
+            self._populate_tree(self.filtered_events)
+
+    def _sync_tree_rows(self, events: Sequence[CalendarEvent], first_index: int) -> None:
+        """Sync the tree with ``events``, touching only rows that changed.
+
+        Rows are keyed by event uid so a filter tweak deletes, inserts, moves or
+        re-renders just the affected items instead of rebuilding every row.
+        ``first_index`` is the position of ``events[0]`` in the full result, so
+        row striping stays stable while a virtual window scrolls. Surviving
+        items keep their selection; the scroll offset is restored.
+
+        Rows are applied TREE_SYNC_CHUNK at a time; the rest follow from idle
+        callbacks so Tk can repaint and handle input in between.
+        """
+        self._cancel_tree_sync()
+        tree = self.tree
+        top_fraction = tree.yview()[0]
+        item_by_uid = self._tree_item_by_uid
+        row_cache = self._tree_row_cache
+        event_map = self._tree_event_map
+
+        keyed: list[tuple[str, CalendarEvent]] = []
+        seen: dict[str, int] = {}
+        for event in events:
+            # Identical currency/time/title entries share a uid; suffix repeats.
+            count = seen.get(event.uid, 0)
+            seen[event.uid] = count + 1
+            keyed.append((event.uid if not count else f"{event.uid}#{count}", event))
+
+        wanted = {key for key, _ in keyed}
+        stale = [key for key in item_by_uid if key not in wanted]
+        if stale:
+            stale_items = [item_by_uid.pop(key) for key in stale]
+            tree.delete(*stale_items)
+            for item_id in stale_items:
+                event_map.pop(item_id, None)
+                row_cache.pop(item_id, None)
+            removed = set(stale_items)
+            self._tree_order = [item for item in self._tree_order if item not in removed]
+
+        self._sync_tree_chunk(keyed, first_index, 0, top_fraction)
+
+    def _sync_tree_chunk(
+        self,
+        keyed: list[tuple[str, CalendarEvent]],
+        first_index: int,
+        start: int,
+        top_fraction: float,
+    ) -> None:
+        self._tree_sync_job = None
+        tree = self.tree
+        item_by_uid = self._tree_item_by_uid
+        row_cache = self._tree_row_cache
+        event_map = self._tree_event_map
+        format_row = self._format_row_values
+        stop = min(start + TREE_SYNC_CHUNK, len(keyed))
+
+        # Talk to Tcl directly for the per-row calls; the ttk wrappers only
+        # rebuild the same option list on every insert.
+        tk_call = tree.tk.call
+        widget = tree._w
+        order = self._tree_order
+        new_uids = self._new_event_uids
+        changed_uids = self._changed_event_uids
+        for index in range(start, stop):
+            key, event = keyed[index]
+            if event.uid in new_uids:
+                state = 1
+            elif event.uid in changed_uids:
+                state = 2
+            else:
+                state = 0
+            tags = ROW_TAGS[event.impact, (first_index + index) & 1, state]
+
+            values = format_row(event)
+            row = (values, tags)
+
+            item_id = item_by_uid.get(key)
+            if item_id is None:
+                position = "end" if index >= len(order) else index
+                item_id = tk_call(widget, "insert", "", position, "-values", values, "-tags", tags)
+                item_by_uid[key] = item_id
+                order.insert(index, item_id)
+            else:
+                if row_cache.get(item_id) != row:
+                    tk_call(widget, "item", item_id, "-values", values, "-tags", tags)
+                if order[index] != item_id:
+                    tree.move(item_id, "", index)
+                    order.remove(item_id)
+                    order.insert(index, item_id)
+            row_cache[item_id] = row
+            event_map[item_id] = event
+
+        if stop < len(keyed):
+            self._tree_sync_job = self.after_idle(
+                lambda: self._sync_tree_chunk(keyed, first_index, stop, top_fraction)
             )
-            self._tree_event_map[item_id] = event
+        elif tree.yview()[0] != top_fraction:
+            tree.yview_moveto(top_fraction)
+
+    def _cancel_tree_sync(self) -> None:
+        if self._tree_sync_job is not None:
+            self.after_cancel(self._tree_sync_job)
+            self._tree_sync_job = None
+
+    @staticmethod
+    def _format_row_values(event: CalendarEvent) -> tuple[str, ...]:
+        return (
+            event.display_date,
+            event.display_time,
+            event.currency,
+            event.impact.value,
+            event.title,
+            event.actual or "n/a",
+            event.forecast or "n/a",
+            event.previous or "n/a",
+        )
 
     def _on_tree_double_click(self, _event: object) -> None:
         selection = self.tree.selection()
@@ -728,6 +1225,7 @@ class ForexNewsApp(Window):
         self._new_event_uids.clear()
         self._changed_event_uids.clear()
         self.all_events = events
+        self._index_events(events)
         self.latest_event_date = self._latest_event_date(events)
         self.apply_filters(status_prefix='Loaded cached calendar after failure')
         self._update_last_updated(
@@ -760,7 +1258,7 @@ class ForexNewsApp(Window):
         except CalendarAPIError as exc:
             Messagebox.show_error("Export failed", str(exc), parent=self)
             return
-        Messagebox.show_info("Export complete", "Saved Markdown", parent=self)
+        self._show_toast(f"Export complete: saved Markdown to {output_path}")
 
     def _show_settings_dialog(self) -> None:
         dialog = tk.Toplevel(self)
@@ -803,6 +1301,8 @@ class ForexNewsApp(Window):
         dialog.wait_window()
 
     def _choose_export_directory(self, var: tk.StringVar) -> None:
+        from tkinter import filedialog
+
         path = filedialog.askdirectory(title="Select export directory")
         if path:
             var.set(path)
@@ -828,21 +1328,25 @@ class ForexNewsApp(Window):
         self.refresh_data(force=True)
 
     def _on_exit(self) -> None:
+        self._cancel_scheduled_filter()
         self._cancel_auto_refresh()
         self.alert_manager.cancel_all()
-        self.save_preferences()
+        self._closing.set()
+        self._background_jobs.put(None)
+        self.client.close()
+        # Let queued writes finish, then write whatever they did not cover.
+        self._preferences_writer.shutdown(wait=True)
+        self._save_preferences_now()
         self.destroy()
 
-    def _latest_event_date(self, events: Iterable[CalendarEvent]) -> date | None:
-        try:
-            return max(event.datetime_local.date() for event in events)
-        except ValueError:
-            return None
+    def _latest_event_date(self, events: Sequence[CalendarEvent]) -> date | None:
+        """Return the local date of the last event in chronologically sorted ``events``."""
+
+        return events[-1].datetime_local.date() if events else None
 
     def _format_status(self, prefix: str) -> str:
         count = len(self.filtered_events)
-        plural = "s" if count != 1 else ""
-        return f"{prefix} - {count} event{plural} visible"
+        return STATUS_FORMAT % (prefix, count, "" if count == 1 else "s")
 
     def _update_last_updated(
         self, *, source: str, fetched_at: datetime | None, from_cache: bool
@@ -861,7 +1365,7 @@ class ForexNewsApp(Window):
         )
 
     def _format_event_details(self, event: CalendarEvent) -> str:
-        local_time = event.datetime_local.strftime("%Y-%m-%d %I:%M %p %Z").lstrip("0")
+        local_time = event.display_local
         utc_time = event.datetime_utc.strftime("%Y-%m-%d %H:%M UTC")
         lines = [
             event.title,
@@ -886,8 +1390,7 @@ class ForexNewsApp(Window):
             raise ValueError(f"{raw!r} is not a valid date (use YYYY-MM-DD)") from exc
 
     def _parse_currencies(self, raw: str) -> Sequence[str]:
-        tokens = [token.strip().upper() for token in raw.split(",")]
-        return [token for token in tokens if token]
+        return _parse_currency_list(raw)
 
     def _default_filter_date(self) -> str:
         return date.today().strftime("%Y-%m-%d")
@@ -895,10 +1398,15 @@ class ForexNewsApp(Window):
     def _event_changed(
         self, previous: CalendarEvent, current: CalendarEvent
     ) -> bool:
-        fields = ("impact", "actual", "forecast", "previous")
-        return any(getattr(previous, field) != getattr(current, field) for field in fields)
+        return (
+            previous.impact != current.impact
+            or previous.actual != current.actual
+            or previous.forecast != current.forecast
+            or previous.previous != current.previous
+        )
 
     def _update_auto_refresh_state(self) -> None:
+        self._unchanged_refreshes = 0
         if self.auto_refresh_var.get():
             self._schedule_auto_refresh(immediate=True)
         else:
@@ -910,15 +1418,57 @@ class ForexNewsApp(Window):
         minutes = self._get_auto_refresh_minutes()
         if minutes <= 0:
             return
-        delay_ms = 1000 if immediate else minutes * 60 * 1000
+        delay_ms = 1000 if immediate else int(self._auto_refresh_delay(minutes) * 1000)
         self._auto_refresh_job = self.after(delay_ms, self._auto_refresh_tick)
 
     def _auto_refresh_tick(self) -> None:
         self._auto_refresh_job = None
         if not self.auto_refresh_var.get():
             return
+        if self._fetch_busy:
+            # A manual refresh or the cache load owns the worker; try later.
+            self._schedule_auto_refresh(immediate=False)
+            return
+        self._auto_refresh_in_flight = True
         self.refresh_data(force=False)
-        self._schedule_auto_refresh(immediate=True)
+        if not self._fetch_busy:
+            # The cached calendar was still current, so no fetch will finish.
+            self._finish_auto_refresh(changed=None)
+
+    def _finish_auto_refresh(self, *, changed: bool | None) -> None:
+        """Arm the next auto refresh once the fetch started by a tick is done.
+
+        ``changed`` is ``None`` when no payload was compared, which leaves the
+        backoff untouched. Manual refreshes never reach the counter.
+        """
+
+        if not self._auto_refresh_in_flight:
+            return
+        self._auto_refresh_in_flight = False
+        if changed is not None:
+            self._unchanged_refreshes = 0 if changed else self._unchanged_refreshes + 1
+        if self.auto_refresh_var.get():
+            self._schedule_auto_refresh(immediate=False)
+
+    def _auto_refresh_delay(self, minutes: int) -> float:
+        """Seconds until the next auto refresh.
+
+        Each refresh that brought no new or changed events stretches the
+        interval, but never past the next high-impact release (or the chosen
+        interval, whichever is later) so its actual figure is picked up.
+        """
+
+        base = minutes * 60
+        backoff = min(AUTO_REFRESH_MAX_BACKOFF, 1 + self._unchanged_refreshes)
+        if backoff == 1:
+            return base
+        now = time.time()
+        all_events = self.all_events
+        for index in self._event_index.by_impact.get(ImpactLevel.HIGH, ()):
+            release = all_events[index].datetime_utc.timestamp()
+            if release > now:
+                return min(base * backoff, max(base, release - now))
+        return base * backoff
 
     def _cancel_auto_refresh(self) -> None:
         if self._auto_refresh_job is not None:
@@ -926,12 +1476,18 @@ class ForexNewsApp(Window):
             self._auto_refresh_job = None
 
     def _get_auto_refresh_minutes(self) -> int:
+        if self._auto_refresh_minutes is not None:
+            return self._auto_refresh_minutes
         try:
             minutes = int(self.auto_refresh_interval_var.get())
         except (TypeError, ValueError):
             minutes = DEFAULT_AUTO_REFRESH_MINUTES
             self.auto_refresh_interval_var.set(str(minutes))
-        return max(minutes, 0)
+        self._auto_refresh_minutes = max(minutes, 0)
+        return self._auto_refresh_minutes
+
+    def _invalidate_auto_refresh_minutes(self, *_args: object) -> None:
+        self._auto_refresh_minutes = None
 
 
 class AlertManager:
@@ -949,17 +1505,24 @@ class AlertManager:
             DEFAULT_ALERT_SOUND if DEFAULT_ALERT_SOUND.exists() else None
         )
         self.custom_sound_path: Path | None = self._resolve_sound_path(prefs.sound_path)
-        self._jobs: dict[tuple[str, str], str] = {}
+        # Pending reminders as (fire_at epoch seconds, seq, event, label), served
+        # by a single after() timer armed for the earliest entry.
+        self._heap: list[tuple[float, int, CalendarEvent, str]] = []
+        self._seq = itertools.count()
+        self._timer: str | None = None
+        self._alert_popup: tk.Toplevel | None = None
+        self._alert_queue: deque[CalendarEvent] = deque()
+        self._alert_title_var = tk.StringVar(master=app)
+        self._alert_time_var = tk.StringVar(master=app)
+        # Events and offsets the heap was last built from; None when empty.
+        self._scheduled_from: tuple[object, dict[ImpactLevel, tuple[int, ...]]] | None = None
 
     def update_preferences(self, prefs: AlertPreferences) -> None:
         self.enabled_var.set(prefs.enabled)
         self.snooze_minutes.set(prefs.snooze_minutes)
         self.reminder_offsets[ImpactLevel.HIGH] = list(prefs.offsets or [60, 30, 15, 5])
         self.custom_sound_path = self._resolve_sound_path(prefs.sound_path)
-        if self.enabled_var.get():
-            self.reload_events(self.app.all_events)
-        else:
-            self.cancel_all()
+        self._reschedule()
 
     def _resolve_sound_path(self, value: str | None) -> Path | None:
         if value:
@@ -983,30 +1546,78 @@ class AlertManager:
         )
 
     def toggle(self) -> None:
-        if self.enabled_var.get():
-            self.reload_events(self.app.all_events)
-        else:
-            self.cancel_all()
+        self._reschedule()
         self.app.save_preferences()
 
+    def _reschedule(self) -> None:
+        """Rebuild reminders only if the events or offsets they came from changed.
+
+        Snooze and sound changes leave the pending heap untouched.
+        """
+
+        if not self.enabled_var.get():
+            self.cancel_all()
+            return
+        scheduled = self._scheduled_from
+        if (
+            scheduled is not None
+            and scheduled[0] is self.app.all_events
+            and scheduled[1] == self._offsets_snapshot()
+        ):
+            return
+        self.reload_events(self.app.all_events)
+
+    def _offsets_snapshot(self) -> dict[ImpactLevel, tuple[int, ...]]:
+        return {impact: tuple(offsets) for impact, offsets in self.reminder_offsets.items()}
+
     def reload_events(self, events: Iterable[CalendarEvent]) -> None:
         self.cancel_all()
         if not self.enabled_var.get():
             return
+        now = time.time()
+        heap = self._heap
         for event in events:
             offsets = self.reminder_offsets.get(event.impact)
             if not offsets:
                 continue
+            event_ts = event.datetime_local.timestamp()
             for offset in offsets:
-                self._schedule_event(event, offset)
+                fire_at = event_ts - offset * 60
+                if fire_at - now > 1:
+                    heap.append((fire_at, next(self._seq), event, f"offset-{offset}"))
+        heapq.heapify(heap)
+        self._scheduled_from = (events, self._offsets_snapshot())
+        self._arm_timer()
 
     def cancel_all(self) -> None:
-        for job_id in self._jobs.values():
+        self._cancel_timer()
+        self._heap.clear()
+        self._scheduled_from = None
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
             try:
-                self.app.after_cancel(job_id)
+                self.app.after_cancel(self._timer)
             except Exception:
                 pass
-        self._jobs.clear()
+            self._timer = None
+
+    def _arm_timer(self) -> None:
+        self._cancel_timer()
+        if self._heap:
+            delay_ms = max(0, int((self._heap[0][0] - time.time()) * 1000))
+            self._timer = self.app.after(delay_ms, self._fire_due)
+
+    def _fire_due(self) -> None:
+        self._timer = None
+        now = time.time()
+        due: list[tuple[CalendarEvent, str]] = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, event, label = heapq.heappop(self._heap)
+            due.append((event, label))
+        self._arm_timer()
+        for event, label in due:
+            self._trigger_alert(event, label)
 
     def show_settings_dialog(self) -> None:
         dialog = tk.Toplevel(self.app)
@@ -1110,10 +1721,12 @@ class AlertManager:
         self.reminder_offsets[ImpactLevel.HIGH] = sorted({abs(offset) for offset in offsets}, reverse=True)
         self.snooze_minutes.set(max(1, abs(snooze_minutes)))
         dialog.destroy()
-        self.reload_events(self.app.all_events)
+        self._reschedule()
         self.app.save_preferences()
 
     def _choose_sound(self, sound_var: tk.StringVar) -> None:
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="Select alert sound",
             filetypes=[("WAV files", "*.wav"), ("All files", "*.*")],
@@ -1137,65 +1750,55 @@ class AlertManager:
             candidate = self.custom_sound_path or self.default_sound_path
         self._play_sound(path=candidate)
 
-    def _schedule_event(
-        self,
-        event: CalendarEvent,
-        offset_minutes: int,
-        *,
-        label: str | None = None,
-        absolute_time: datetime | None = None,
-    ) -> None:
-        if label is None:
-            label = f"offset-{offset_minutes}"
-
-        if absolute_time is None:
-            reminder_time = event.datetime_local - timedelta(minutes=offset_minutes)
-        else:
-            reminder_time = absolute_time
+    def _schedule_event(self, event: CalendarEvent, fire_at: float, label: str) -> None:
+        """Push one reminder due at epoch ``fire_at``; re-arm if it is now the earliest."""
 
-        tz_now = datetime.now(event.datetime_local.tzinfo or datetime.now().astimezone().tzinfo)
-        delay_seconds = (reminder_time - tz_now).total_seconds()
-        if delay_seconds <= 1:
+        if fire_at - time.time() <= 1:
             return
 
-        job_id = self.app.after(
-            int(delay_seconds * 1000),
-            lambda e=event, lbl=label: self._trigger_alert(e, lbl),
-        )
-        self._jobs[(event.uid, label)] = job_id
+        entry = (fire_at, next(self._seq), event, label)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._arm_timer()
 
     def _schedule_snooze(self, event: CalendarEvent) -> None:
-        minutes = max(1, self.snooze_minutes.get())
-        tz_now = datetime.now(event.datetime_local.tzinfo or datetime.now().astimezone().tzinfo)
-        label = f"snooze-{datetime.now().timestamp()}"
-        reminder_time = tz_now + timedelta(minutes=minutes)
-        self._schedule_event(event, minutes, label=label, absolute_time=reminder_time)
+        fire_at = time.time() + max(1, self.snooze_minutes.get()) * 60
+        self._schedule_event(event, fire_at, f"snooze-{fire_at}")
 
     def _trigger_alert(self, event: CalendarEvent, label: str) -> None:
-        job = self._jobs.pop((event.uid, label), None)
-        if job is None or not self.enabled_var.get():
+        if not self.enabled_var.get():
             return
 
         self._play_sound()
         self._show_alert_popup(event)
 
     def _show_alert_popup(self, event: CalendarEvent) -> None:
+        self._alert_queue.append(event)
+        popup = self._alert_popup
+        if popup is None:
+            popup = self._alert_popup = self._build_alert_popup()
+        elif popup.state() != "withdrawn":
+            # Reminders due together wait behind the one on screen.
+            return
+        self._present_next_alert()
+
+    def _build_alert_popup(self) -> tk.Toplevel:
+        """Create the reminder window once; later reminders reuse it."""
+
         popup = tk.Toplevel(self.app)
+        popup.withdraw()
         popup.title("High Impact Reminder")
         popup.transient(self.app)
-        popup.grab_set()
         popup.resizable(False, False)
-        popup.attributes("-topmost", True)
+        popup.protocol("WM_DELETE_WINDOW", self._on_dismiss)
 
         Frame(popup, height=10).pack()
         Label(
             popup,
-            text=f"{event.title} ({event.currency})",
+            textvariable=self._alert_title_var,
             font=("Segoe UI", 12, "bold"),
         ).pack(padx=16, pady=(0, 6))
-
-        local_time = event.datetime_local.strftime("%Y-%m-%d %I:%M %p %Z").lstrip("0")
-        Label(popup, text=f"Scheduled for {local_time}").pack(padx=16)
+        Label(popup, textvariable=self._alert_time_var).pack(padx=16)
 
         Frame(popup, height=12).pack()
         button_frame = Frame(popup)
@@ -1204,31 +1807,51 @@ class AlertManager:
         Button(
             button_frame,
             text="Snooze",
-            command=lambda: self._on_snooze(event, popup),
+            command=self._on_snooze,
             bootstyle="secondary",
         ).pack(side=LEFT)
 
         Button(
             button_frame,
             text="Dismiss",
-            command=popup.destroy,
+            command=self._on_dismiss,
             bootstyle="primary",
         ).pack(side=RIGHT)
+        return popup
 
+    def _present_next_alert(self) -> None:
+        popup = self._alert_popup
+        if popup is None:
+            return
+        if not self._alert_queue:
+            popup.grab_release()
+            popup.withdraw()
+            return
+        event = self._alert_queue[0]
+        self._alert_title_var.set(f"{event.title} ({event.currency})")
+        self._alert_time_var.set(f"Scheduled for {event.display_local}")
+        popup.deiconify()
+        popup.lift()
+        popup.grab_set()
+        popup.attributes("-topmost", True)
         # After forcing topmost, allow focus to return to app later
         popup.after(3000, lambda: popup.attributes("-topmost", False))
 
-    def _on_snooze(self, event: CalendarEvent, popup: tk.Toplevel) -> None:
-        popup.destroy()
-        self._schedule_snooze(event)
+    def _on_dismiss(self) -> None:
+        if self._alert_queue:
+            self._alert_queue.popleft()
+        self._present_next_alert()
+
+    def _on_snooze(self) -> None:
+        if self._alert_queue:
+            self._schedule_snooze(self._alert_queue.popleft())
+        self._present_next_alert()
 
     def _play_sound(self, path: Path | None = None) -> None:
         candidate = path or self.custom_sound_path or self.default_sound_path
         if candidate and candidate.exists():
             try:
-                if platform.system() == "Windows":
-                    import winsound
-
+                if winsound is not None:
                     winsound.PlaySound(
                         str(candidate),
                         winsound.SND_FILENAME | winsound.SND_ASYNC,
@@ -1237,9 +1860,7 @@ class AlertManager:
             except Exception:
                 pass
         try:
-            if platform.system() == "Windows":
-                import winsound
-
+            if winsound is not None:
                 winsound.MessageBeep()
             else:
                 self.app.bell()
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict
 
+from .fileio import loads, orjson
+
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "data" / "config.json"
 MEDIA_PATH = Path(__file__).resolve().parent.parent / "media"
 DEFAULT_ALERT_SOUND = MEDIA_PATH / "Cyber_News_mp3.wav"
@@ -23,6 +25,12 @@ class AlertPreferences:
     sound_path: str | None = DEFAULT_ALERT_SOUND_STR
 
 
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def _clean_optional_str(value: Any) -> str | None:
     if isinstance(value, str):
         stripped = value.strip()
@@ -56,7 +64,7 @@ class ConfigManager:
 
     def load(self) -> AppPreferences:
         try:
-            data = json.loads(self.path.read_text(encoding="utf-8"))
+            data = loads(self.path.read_bytes())
         except FileNotFoundError:
             return self.preferences
         except ValueError:
@@ -125,9 +133,7 @@ class ConfigManager:
             },
         }
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        self.path.write_bytes(_dumps(payload))
 
 
 __all__ = [
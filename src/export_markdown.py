@@ -3,26 +3,29 @@
 from __future__ import annotations
 
 import argparse
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from .api_client import CalendarClient, CalendarFetchResult, CalendarAPIError
+from .api_client import CalendarAPIError, CalendarClient, CalendarFetchResult
+from .fileio import write_bytes
 from .models import (
     CalendarEvent,
     ImpactLevel,
     build_events,
-    filter_by_currency,
-    filter_by_impact,
+    filter_events,
     group_events_by_day,
-    search_events,
-    sort_events,
 )
 
 DEFAULT_TITLE = "Upcoming News"
 DEFAULT_EXPORT_DIR = Path(__file__).resolve().parent.parent / "exports"
 TABLE_HEADER = "| Time | Currency | Event | Actual | Forecast | Previous |"
 TABLE_DIVIDER = "|------|----------|-------|--------|----------|----------|"
+WEEKDAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_NAMES = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
 
 
 def render_markdown(
@@ -37,7 +40,11 @@ def render_markdown(
     filtered_events = filtered_events if filtered_events is not None else all_events
 
     day_groups = group_events_by_day(all_events, use_local_time=use_local_time)
-    filtered_groups = group_events_by_day(filtered_events, use_local_time=use_local_time)
+    # Unfiltered exports pass the same events (often as a copy); group them once.
+    if _same_events(filtered_events, all_events):
+        filtered_groups = day_groups
+    else:
+        filtered_groups = group_events_by_day(filtered_events, use_local_time=use_local_time)
 
     lines: list[str] = [f"# {title}", ""]
 
@@ -46,7 +53,7 @@ def render_markdown(
         return "\n".join(lines) + "\n"
 
     for day, _ in day_groups.items():
-        day_label = day.strftime("%a %b %d")
+        day_label = _format_day(day)
         day_events = filtered_groups.get(day, [])
 
         lines.append(f"## {day_label}")
@@ -57,40 +64,50 @@ def render_markdown(
 
         lines.append(TABLE_HEADER)
         lines.append(TABLE_DIVIDER)
-        for event in sort_events(day_events, by_impact_first=False):
-            lines.append(_format_event_row(event, use_local_time=use_local_time))
+        # group_events_by_day already orders each day chronologically.
+        lines.extend(
+            [_format_event_row(event, use_local_time=use_local_time) for event in day_events]
+        )
         lines.append("")
 
     return "\n".join(lines).rstrip() + "\n"
 
 
+def _same_events(
+    first: Sequence[CalendarEvent], second: Sequence[CalendarEvent]
+) -> bool:
+    return first is second or (
+        len(first) == len(second) and all(a is b for a, b in zip(first, second))
+    )
+
+
 def _format_event_row(event: CalendarEvent, *, use_local_time: bool) -> str:
     dt = event.datetime_local if use_local_time else event.datetime_utc
-    time_value = _format_time(dt)
-    actual = _safe_value(event.actual)
-    forecast = _safe_value(event.forecast)
-    previous = _safe_value(event.previous)
+    # Missing values render as "n/a"; inlined so each row is a single f-string.
     return (
-        f"| {time_value} | {event.currency} | {event.title} | "
-        f"{actual} | {forecast} | {previous} |"
+        f"| {_format_time(dt)} | {event.currency} | {event.title} | "
+        f"{event.actual or 'n/a'} | {event.forecast or 'n/a'} | {event.previous or 'n/a'} |"
     )
 
 
 def _format_time(dt: datetime) -> str:
-    rendered = dt.strftime("%I:%M%p").lower()
-    # Remove leading zero while keeping midnight as "12".
-    if rendered.startswith("0"):
-        rendered = rendered[1:]
-    return rendered
+    """Same as ``strftime("%I:%M%p").lower()`` minus the leading zero."""
 
+    hour = dt.hour
+    return f"{hour % 12 or 12}:{dt.minute:02d}{'pm' if hour >= 12 else 'am'}"
 
-def _safe_value(value: str | None) -> str:
-    return value if value else "n/a"
+
+def _format_day(day: date) -> str:
+    """Same as ``strftime("%a %b %d")`` in the C locale."""
+
+    return f"{WEEKDAY_NAMES[day.weekday()]} {MONTH_NAMES[day.month - 1]} {day.day:02d}"
 
 
 def write_markdown(markdown: str, output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(markdown, encoding="utf-8")
+    # Encode once and write the bytes straight to the descriptor, skipping the
+    # text-mode file wrapper.
+    write_bytes(output_path, markdown.encode("utf-8"))
     return output_path
 
 
@@ -102,7 +119,10 @@ def build_default_output_path(
 ) -> Path:
     timestamp = timestamp or datetime.now()
     slug = "-".join(sorted({impact.value.lower() for impact in impacts})) or "all"
-    filename = f"{slug}_impact_news_{timestamp.strftime('%Y%m%d_%H%M')}.md"
+    filename = (
+        f"{slug}_impact_news_{timestamp.year:04d}{timestamp.month:02d}{timestamp.day:02d}"
+        f"_{timestamp.hour:02d}{timestamp.minute:02d}.md"
+    )
     return export_dir / filename
 
 
@@ -118,13 +138,9 @@ def fetch_events(
     fetch_result = client.fetch()
     all_events = build_events(fetch_result.events)
 
-    working = list(all_events)
-    if impacts:
-        working = filter_by_impact(working, impacts)
-    if currencies:
-        working = filter_by_currency(working, currencies)
-    if search:
-        working = search_events(working, search)
+    working = filter_events(
+        all_events, impacts=impacts, currencies=currencies, search=search
+    )
 
     return all_events, working, fetch_result
 
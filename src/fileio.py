@@ -0,0 +1,62 @@
+"""Low-level file and JSON helpers shared by the cache, config and exporters."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def loads(data: bytes) -> Any:
+    """Decode JSON ``data``, with orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_all(fd: int, data: bytes) -> None:
+    """Write every byte of ``data`` to the open descriptor ``fd``."""
+
+    # The payload is already encoded, so go straight to the descriptor rather
+    # than through Python's buffered file objects.
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Replace the contents of ``path`` with ``data`` in place."""
+
+    fd = os.open(path, WRITE_FLAGS, 0o644)
+    try:
+        write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file."""
+
+    # Write to a sibling file first so a crash never leaves a truncated file.
+    # Each writer gets its own uniquely named temp file, so concurrent clients
+    # (the app worker, an export, the CLI) cannot truncate each other's writes.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        try:
+            write_all(fd, data)
+        finally:
+            os.close(fd)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
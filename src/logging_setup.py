@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -12,7 +14,11 @@ LOG_FILE = LOG_DIR / "app.log"
 
 
 def configure_logging(level: int = logging.INFO, max_bytes: int = 1_000_000, backups: int = 5) -> None:
-    """Configure a rotating file handler for application logging."""
+    """Configure a rotating file handler for application logging.
+
+    Records are handed to a queue and written by a listener thread, so logging
+    from the UI thread never waits on file I/O or rotation.
+    """
 
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -23,9 +29,15 @@ def configure_logging(level: int = logging.INFO, max_bytes: int = 1_000_000, bac
     )
     handler.setFormatter(formatter)
 
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    # Flush what is still queued when the interpreter exits.
+    atexit.register(listener.stop)
+
     root = logging.getLogger()
     root.setLevel(level)
-    root.addHandler(handler)
+    root.addHandler(QueueHandler(records))
 
 
 __all__ = ["configure_logging", "LOG_FILE"]
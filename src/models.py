@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Iterable, Mapping, MutableMapping, Optional, Sequence
-
-from dateutil import parser as date_parser
+from operator import attrgetter
+from typing import Collection, Iterable, Mapping, MutableMapping, Optional, Sequence
 
 try:
     from datetime import UTC  # type: ignore[attr-defined]
@@ -30,12 +31,14 @@ class ImpactLevel(str, Enum):
     def from_value(cls, value: Optional[str]) -> "ImpactLevel":
         if not value:
             return cls.UNKNOWN
-        normalized = value.strip().title()
-        for member in cls:
-            if member.value == normalized:
-                return member
-        return cls.UNKNOWN
+        member = _IMPACT_BY_VALUE.get(value)
+        if member is None:
+            member = _IMPACT_BY_VALUE.get(value.strip().title(), cls.UNKNOWN)
+        return member
+
 
+# Feed values are already title-cased, so most lookups hit on the first get.
+_IMPACT_BY_VALUE: dict[str, ImpactLevel] = {member.value: member for member in ImpactLevel}
 
 IMPACT_SORT_WEIGHT: Mapping[ImpactLevel, int] = {
     ImpactLevel.HIGH: 0,
@@ -61,6 +64,50 @@ class CalendarEvent:
     previous: Optional[str] = None
     actual: Optional[str] = None
     raw: Mapping[str, object] = field(default_factory=dict, repr=False)
+    # Local date/time labels rendered once so table views don't call strftime
+    # on every refresh.
+    display_date: str = field(init=False, repr=False, compare=False)
+    display_time: str = field(init=False, repr=False, compare=False)
+    sort_weight: int = field(init=False, repr=False, compare=False)
+    _display_local: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _search_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        local = self.datetime_local
+        object.__setattr__(self, "display_date", _format_date(local))
+        object.__setattr__(self, "display_time", _format_time_12h(local))
+        object.__setattr__(self, "sort_weight", IMPACT_SORT_WEIGHT.get(self.impact, 9))
+
+    @property
+    def display_local(self) -> str:
+        """Full local timestamp with zone name, formatted on first use."""
+
+        if self._display_local is None:
+            text = self.datetime_local.strftime("%Y-%m-%d %I:%M %p %Z").lstrip("0")
+            object.__setattr__(self, "_display_local", text)
+        return self._display_local
+
+    @property
+    def search_text(self) -> str:
+        """Lowercased searchable fields, built once and reused by every search.
+
+        Fields are joined with a unit separator so a query cannot match across
+        two of them.
+        """
+
+        if self._search_text is None:
+            text = "\x1f".join(
+                (
+                    self.title,
+                    self.currency,
+                    self.impact.value,
+                    self.forecast or "",
+                    self.previous or "",
+                    self.actual or "",
+                )
+            ).lower()
+            object.__setattr__(self, "_search_text", text)
+        return self._search_text
 
     @classmethod
     def from_api_payload(
@@ -69,12 +116,13 @@ class CalendarEvent:
         date_value = _coerce_str(payload.get("date"))
         if not date_value:
             raise ValueError("Calendar event payload missing `date` string")
-        parsed = date_parser.isoparse(date_value)
+        parsed = _parse_iso_datetime(date_value)
         datetime_utc = parsed.astimezone(UTC)
         datetime_local = parsed.astimezone() if include_local else datetime_utc
 
         title = _coerce_str(payload.get("title")) or "Untitled"
-        currency = _coerce_str(payload.get("country")) or "N/A"
+        # Few distinct codes repeat across thousands of events; share one string each.
+        currency = sys.intern(_coerce_str(payload.get("country")) or "N/A")
         impact = ImpactLevel.from_value(_coerce_str(payload.get("impact")))
 
         uid = cls._build_uid(currency, title, datetime_utc)
@@ -89,7 +137,8 @@ class CalendarEvent:
             forecast=_coerce_optional_str(payload.get("forecast")),
             previous=_coerce_optional_str(payload.get("previous")),
             actual=_coerce_optional_str(payload.get("actual")),
-            raw=dict(payload),
+            # Kept by reference: the payload dicts already live in the fetch result.
+            raw=payload,
         )
 
     @staticmethod
@@ -98,7 +147,7 @@ class CalendarEvent:
 
     @property
     def sort_key(self) -> tuple[int, datetime]:
-        return (IMPACT_SORT_WEIGHT.get(self.impact, 9), self.datetime_utc)
+        return (self.sort_weight, self.datetime_utc)
 
 
 def build_events(payload: Iterable[Mapping[str, object]]) -> list[CalendarEvent]:
@@ -111,17 +160,31 @@ def build_events(payload: Iterable[Mapping[str, object]]) -> list[CalendarEvent]
 def group_events_by_day(
     events: Iterable[CalendarEvent], *, use_local_time: bool = True
 ) -> dict[date, list[CalendarEvent]]:
-    buckets: MutableMapping[date, list[CalendarEvent]] = defaultdict(list)
-    for event in events:
-        key_date = (event.datetime_local if use_local_time else event.datetime_utc).date()
-        buckets[key_date].append(event)
+    # One sort of (timestamp, weight, title) keys replaces a sort per bucket;
+    # the ordered walk then only appends.
+    keyed = [
+        (
+            event.datetime_local if use_local_time else event.datetime_utc,
+            event.sort_weight,
+            event.title.lower(),
+            index,
+            event,
+        )
+        for index, event in enumerate(events)
+    ]
+    keyed.sort()
 
-    for day_events in buckets.values():
-        day_events.sort(key=lambda event: ((event.datetime_local if use_local_time else event.datetime_utc), IMPACT_SORT_WEIGHT.get(event.impact, 9), event.title.lower()))
+    buckets: MutableMapping[date, list[CalendarEvent]] = defaultdict(list)
+    for moment, _weight, _title, _index, event in keyed:
+        buckets[moment.date()].append(event)
 
     return dict(sorted(buckets.items(), key=lambda item: item[0]))
 
 
+_BY_IMPACT_THEN_TIME = attrgetter("sort_weight", "datetime_utc")
+_BY_TIME = attrgetter("datetime_utc")
+
+
 def filter_by_impact(
     events: Iterable[CalendarEvent], impacts: Sequence[ImpactLevel]
 ) -> list[CalendarEvent]:
@@ -133,7 +196,12 @@ def filter_by_currency(
     events: Iterable[CalendarEvent], currencies: Sequence[str]
 ) -> list[CalendarEvent]:
     normalized = {currency.upper() for currency in currencies}
-    return [event for event in events if event.currency.upper() in normalized]
+    # Feed codes are already upper case, so the upper() call is rarely needed.
+    return [
+        event
+        for event in events
+        if event.currency in normalized or event.currency.upper() in normalized
+    ]
 
 
 def filter_by_date_range(
@@ -170,24 +238,184 @@ def search_events(events: Iterable[CalendarEvent], query: str) -> list[CalendarE
     return results
 
 
+def filter_events(
+    events: Iterable[CalendarEvent],
+    *,
+    impacts: Sequence[ImpactLevel] | None = None,
+    currencies: Sequence[str] | None = None,
+    search: str | None = None,
+) -> list[CalendarEvent]:
+    """Apply the impact, currency and search filters in a single pass.
+
+    Equivalent to chaining ``filter_by_impact``, ``filter_by_currency`` and
+    ``search_events`` without building the intermediate lists.
+    """
+
+    allowed = set(impacts) if impacts else None
+    normalized = {currency.upper() for currency in currencies} if currencies else None
+    needle = search.lower() if search else None
+
+    results: list[CalendarEvent] = []
+    append = results.append
+    for event in events:
+        if allowed is not None and event.impact not in allowed:
+            continue
+        if normalized is not None and not (
+            event.currency in normalized or event.currency.upper() in normalized
+        ):
+            continue
+        if needle is not None and needle not in event.search_text:
+            continue
+        append(event)
+    return results
+
+
 def sort_events(
     events: Iterable[CalendarEvent], *, by_impact_first: bool = True
 ) -> list[CalendarEvent]:
     if by_impact_first:
-        return sorted(events, key=lambda event: event.sort_key)
-    return sorted(events, key=lambda event: event.datetime_utc)
+        return sorted(events, key=_BY_IMPACT_THEN_TIME)
+    return sorted(events, key=_BY_TIME)
 
 
-def _match_event(event: CalendarEvent, needle: str) -> bool:
-    haystacks = (
-        event.title.lower(),
-        event.currency.lower(),
-        event.impact.value.lower(),
-        _fallback_lower(event.forecast),
-        _fallback_lower(event.previous),
-        _fallback_lower(event.actual),
+@dataclass(slots=True, frozen=True)
+class EventIndex:
+    """Filter lookup tables over one chronologically sorted event list.
+
+    Every table holds positions into that list, in ascending order.
+    """
+
+    by_impact: dict[ImpactLevel, list[int]]
+    by_currency: dict[str, list[int]]
+    search_blob: list[str]
+    local_dates: list[date]
+
+
+def build_event_index(events: Sequence[CalendarEvent]) -> EventIndex:
+    """Index ``events`` (sorted by time) for :func:`select_event_indexes`."""
+
+    by_impact: dict[ImpactLevel, list[int]] = defaultdict(list)
+    by_currency: dict[str, list[int]] = defaultdict(list)
+    search_blob: list[str] = []
+    for position, event in enumerate(events):
+        by_impact[event.impact].append(position)
+        by_currency[event.currency.upper()].append(position)
+        search_blob.append(event.search_text)
+    return EventIndex(
+        by_impact=dict(by_impact),
+        by_currency=dict(by_currency),
+        search_blob=search_blob,
+        local_dates=[event.datetime_local.date() for event in events],
     )
-    return any(needle in hay for hay in haystacks if hay)
+
+
+def search_event_indexes(
+    index: EventIndex,
+    query: str,
+    previous: tuple[str, Sequence[int]] | None = None,
+) -> list[int]:
+    """Return the positions whose search text contains ``query`` (lowercased).
+
+    ``previous`` is an earlier query on the same index with its matches. While
+    the user keeps typing, each query extends the last one, so only those
+    matches need to be rescanned.
+    """
+
+    blob = index.search_blob
+    pool: Iterable[int] = range(len(blob))
+    if previous is not None and query.startswith(previous[0]):
+        pool = previous[1]
+    return [position for position in pool if query in blob[position]]
+
+
+def select_event_indexes(
+    index: EventIndex,
+    *,
+    impacts: Collection[ImpactLevel] | None = None,
+    currencies: Iterable[str] = (),
+    start: date | None = None,
+    end: date | None = None,
+    search_matches: Sequence[int] | None = None,
+) -> Sequence[int]:
+    """Return the ascending positions of the events that pass every filter.
+
+    Matches ``filter_by_impact``, ``filter_by_currency``, ``filter_by_date_range``
+    and ``search_events`` chained over the indexed list; ``None`` or empty
+    arguments leave that filter out, and ``search_matches`` comes from
+    :func:`search_event_indexes`. When only the date bounds apply the result is
+    a ``range``, so callers can slice instead of copying item by item.
+    """
+
+    # The list is chronological, so the date range is one contiguous slice.
+    local_dates = index.local_dates
+    low = bisect_left(local_dates, start) if start else 0
+    high = bisect_right(local_dates, end) if end else len(local_dates)
+
+    # Buckets are sorted, so each is clipped to the date slice before the union.
+    candidates: set[int] | None = None
+    if impacts is not None:
+        candidates = set()
+        for impact in impacts:
+            candidates.update(_clip_sorted(index.by_impact.get(impact, ()), low, high))
+
+    wanted = {currency.upper() for currency in currencies}
+    if wanted:
+        currency_matches: set[int] = set()
+        for currency in wanted:
+            currency_matches.update(
+                _clip_sorted(index.by_currency.get(currency, ()), low, high)
+            )
+        candidates = (
+            currency_matches if candidates is None else candidates & currency_matches
+        )
+
+    if search_matches is not None:
+        matches = _clip_sorted(search_matches, low, high)
+        if candidates is None:
+            return matches
+        return [position for position in matches if position in candidates]
+    if candidates is not None:
+        return sorted(candidates)
+    return range(low, high)
+
+
+def _clip_sorted(positions: Sequence[int], low: int, high: int) -> Sequence[int]:
+    """Return the part of sorted ``positions`` within ``[low, high)``."""
+
+    return positions[bisect_left(positions, low) : bisect_left(positions, high)]
+
+
+def _match_event(event: CalendarEvent, needle: str) -> bool:
+    return needle in event.search_text
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, using dateutil only for unusual formats.
+
+    Shared with ``api_client``, which validates feed dates the same way.
+    """
+
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser as date_parser
+
+        return date_parser.isoparse(value)
+
+
+def _format_date(value: datetime) -> str:
+    """Same as ``strftime("%Y-%m-%d")`` without the locale-aware formatter."""
+
+    return f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+
+
+def _format_time_12h(value: datetime) -> str:
+    """Same as ``strftime("%I:%M %p").lstrip("0")`` in the C locale."""
+
+    hour = value.hour
+    return f"{hour % 12 or 12}:{value.minute:02d} {'PM' if hour >= 12 else 'AM'}"
 
 
 def _coerce_str(value: object) -> Optional[str]:
@@ -204,10 +432,6 @@ def _coerce_optional_str(value: object) -> Optional[str]:
     return stripped or None
 
 
-def _fallback_lower(value: Optional[str]) -> Optional[str]:
-    return value.lower() if isinstance(value, str) else None
-
-
 __all__ = [
     "ImpactLevel",
     "CalendarEvent",
@@ -216,6 +440,7 @@ __all__ = [
     "filter_by_impact",
     "filter_by_currency",
     "filter_by_date_range",
+    "filter_events",
     "search_events",
     "sort_events",
 ]
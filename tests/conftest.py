@@ -1,7 +1,22 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+from src import api_client, config, fileio  # noqa: E402
+
+
+@pytest.fixture(params=["accelerated", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson/ijson (when installed) and with the stdlib fallbacks."""
+
+    if request.param == "stdlib":
+        for module in (fileio, api_client, config):
+            monkeypatch.setattr(module, "orjson", None)
+        monkeypatch.setattr(api_client, "ijson", None)
+    return request.param
@@ -1,23 +1,47 @@
 
 from requests import RequestException
 import json
+import os
+import time
 
 import pytest
 
 from src.api_client import CalendarAPIError, CalendarClient
 from src.models import build_events
 
+# Every test runs against both the orjson/ijson paths and the stdlib fallbacks.
+pytestmark = pytest.mark.usefixtures("json_backend")
+
 
 class DummyResponse:
-    def __init__(self, payload, status_code=200):
+    def __init__(self, payload, status_code=200, headers=None):
         self._payload = payload
         self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
 
     def json(self):
         if isinstance(self._payload, Exception):
             raise self._payload
         return self._payload
 
+    @property
+    def content(self):
+        if isinstance(self._payload, Exception):
+            return b"not json"
+        return json.dumps(self._payload).encode("utf-8")
+
+    def iter_content(self, chunk_size=1):
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
     def raise_for_status(self):
         if self.status_code >= 400:
             from requests import HTTPError
@@ -28,8 +52,10 @@ class DummyResponse:
 class DummySession:
     def __init__(self, responses):
         self._responses = list(responses)
+        self.requests = []
 
-    def get(self, url, timeout):
+    def get(self, url, timeout, **kwargs):
+        self.requests.append(kwargs)
         if self._responses:
             result = self._responses.pop(0)
         else:
@@ -38,6 +64,9 @@ class DummySession:
             raise result
         return result
 
+    def close(self):
+        self.closed = True
+
 
 @pytest.fixture
 def payload():
@@ -60,6 +89,11 @@ def test_fetch_success_with_cache(tmp_path, payload):
     assert not result.from_cache
     assert build_events(result.events)[0].title == "GDP"
     assert json.loads(cache_path.read_text())
+    # Temp files from the atomic writes are moved into place, not left behind.
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "cache.json",
+        "cache.meta.json",
+    ]
 
 
 def test_fetch_uses_cache_when_download_fails(tmp_path, payload):
@@ -68,18 +102,108 @@ def test_fetch_uses_cache_when_download_fails(tmp_path, payload):
         session=DummySession([DummyResponse(payload)]), cache_path=cache_path
     )
     client.fetch()
+    failing_session = DummySession([RequestException("boom")] * 3)
     failing_client = CalendarClient(
-        session=DummySession([RequestException("boom")] * 3),
+        session=failing_session,
         cache_path=cache_path,
+        backoff_seconds=0,
     )
     cached = failing_client.fetch()
     assert cached.from_cache
+    assert len(failing_session.requests) == 3
+
+
+def test_fetch_retries_injected_session(tmp_path, payload):
+    session = DummySession(
+        [RequestException("boom"), DummyResponse(ValueError("bad json")), DummyResponse(payload)]
+    )
+    client = CalendarClient(
+        session=session, cache_path=tmp_path / "cache.json", backoff_seconds=0
+    )
+    result = client.fetch()
+    assert not result.from_cache
+    assert result.events == payload
+    assert len(session.requests) == 3
 
 
 def test_fetch_raises_when_no_cache(tmp_path):
     client = CalendarClient(
         session=DummySession([RequestException("boom")] * 3),
         cache_path=tmp_path / "missing.json",
+        backoff_seconds=0,
     )
     with pytest.raises(CalendarAPIError):
         client.fetch()
+
+
+def test_load_cache_memoizes_until_file_changes(tmp_path, payload):
+    cache_path = tmp_path / "cache.json"
+    client = CalendarClient(
+        session=DummySession([DummyResponse(payload)]), cache_path=cache_path
+    )
+    client.fetch()
+    first = client.load_cache()
+    assert client.load_cache() is first
+    assert CalendarClient(cache_path=cache_path).load_cache() is first
+
+    cache_path.write_text(json.dumps(payload * 2))
+    os.utime(cache_path, ns=(0, cache_path.stat().st_mtime_ns + 1))
+    assert len(client.load_cache().events) == 2
+
+
+def test_fetch_reuses_cache_when_not_modified(tmp_path, payload):
+    cache_path = tmp_path / "cache.json"
+    client = CalendarClient(
+        session=DummySession([DummyResponse(payload, headers={"ETag": '"v1"'})]),
+        cache_path=cache_path,
+    )
+    client.fetch()
+    day_old = time.time() - 86400
+    os.utime(cache_path, (day_old, day_old))
+
+    not_modified = DummyResponse(None, status_code=304)
+    session = DummySession([not_modified])
+    client = CalendarClient(session=session, cache_path=cache_path)
+    result = client.fetch()
+    assert result.from_cache
+    assert result.events == payload
+    assert result.source == client.base_url
+    assert result.fetched_at.timestamp() > day_old + 3600
+    assert session.requests[0]["headers"] == {"If-None-Match": '"v1"'}
+    assert not_modified.closed
+
+
+def test_fetch_skips_validation_when_payload_unchanged(tmp_path, payload, monkeypatch):
+    cache_path = tmp_path / "cache.json"
+    CalendarClient(
+        session=DummySession([DummyResponse(payload)]), cache_path=cache_path
+    ).fetch()
+
+    client = CalendarClient(
+        session=DummySession([DummyResponse(payload)]), cache_path=cache_path
+    )
+    # Warm the cache memo so only a downloaded body could reach validation.
+    client.load_cache()
+    monkeypatch.setattr(client, "_validate_events", pytest.fail)
+    result = client.fetch()
+    assert result.from_cache
+    assert result.events == payload
+
+
+def test_fetch_many_preserves_url_order(tmp_path, payload):
+    class UrlSession:
+        def get(self, url, timeout, **kwargs):
+            return DummyResponse([dict(payload[0], title=url)])
+
+    client = CalendarClient(session=UrlSession(), cache_path=tmp_path / "cache.json")
+    results = client.fetch_many(["this-week", "next-week"])
+    assert [result.source for result in results] == ["this-week", "next-week"]
+    assert [result.events[0]["title"] for result in results] == ["this-week", "next-week"]
+    assert not (tmp_path / "cache.json").exists()
+
+
+def test_close_leaves_injected_session_open(tmp_path):
+    session = DummySession([])
+    client = CalendarClient(session=session, cache_path=tmp_path / "cache.json")
+    client.close()
+    assert not getattr(session, "closed", False)
@@ -0,0 +1,31 @@
+import pytest
+
+from src.config import AppPreferences, ConfigManager
+
+# Every test runs against both orjson and the stdlib json fallback.
+pytestmark = pytest.mark.usefixtures("json_backend")
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "config.json"
+    prefs = AppPreferences(
+        impacts=["High", "Medium"],
+        currencies=["USD", "EUR"],
+        search_text="cpi",
+        start_date="2025-10-01",
+        api_url="https://example.com/feed.json",
+    )
+    prefs.alerts.offsets = [30, 5]
+    prefs.alerts.sound_path = "ping.wav"
+    ConfigManager(path).save(prefs)
+
+    assert path.read_text(encoding="utf-8").startswith('{\n  "window_width"')
+    loaded = ConfigManager(path).load()
+    assert loaded == prefs
+
+
+def test_load_ignores_invalid_json(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_bytes(b"{not json")
+    manager = ConfigManager(path)
+    assert manager.load() is manager.preferences
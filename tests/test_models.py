@@ -1,16 +1,21 @@
 
 import datetime
+import random
 
 import pytest
 
 from src.models import (
     CalendarEvent,
     ImpactLevel,
+    build_event_index,
     build_events,
     filter_by_currency,
     filter_by_date_range,
     filter_by_impact,
+    filter_events,
+    search_event_indexes,
     search_events,
+    select_event_indexes,
     sort_events,
 )
 
@@ -79,9 +84,97 @@ def test_search_events_matches_title(sample_payload):
     assert results[0].title == "GDP"
 
 
+def test_search_events_does_not_match_across_fields(sample_payload):
+    events = build_events(sample_payload)
+    assert [event.title for event in search_events(events, "2.9%")] == ["GDP"]
+    assert search_events(events, "gdpusd") == []
+
+
+def test_filter_events_combines_filters(sample_payload):
+    events = build_events(sample_payload)
+    assert filter_events(events) == events
+    assert [
+        event.title
+        for event in filter_events(
+            events, impacts=[ImpactLevel.HIGH, ImpactLevel.MEDIUM], currencies=["eur"]
+        )
+    ] == ["CPI"]
+    assert filter_events(events, impacts=[ImpactLevel.HIGH], search="cpi") == []
+
+
 def test_sort_events_by_impact_then_time(sample_payload):
     events = build_events(sample_payload)
     sorted_by_time = sort_events(events, by_impact_first=False)
     assert sorted_by_time[0].datetime_utc <= sorted_by_time[1].datetime_utc
     high_first = sort_events(events, by_impact_first=True)
     assert high_first[0].impact is ImpactLevel.HIGH
+
+
+def test_calendar_event_display_labels(sample_payload):
+    event = build_events(sample_payload)[0]
+    local = event.datetime_local
+    assert event.display_date == local.strftime("%Y-%m-%d")
+    assert event.display_time == local.strftime("%I:%M %p").lstrip("0")
+    assert event.display_local == local.strftime("%Y-%m-%d %I:%M %p %Z").lstrip("0")
+
+    for hour in range(24):
+        moved = CalendarEvent.from_api_payload(
+            dict(sample_payload[0], date=f"2025-01-05T{hour:02d}:07:00+00:00"),
+            include_local=False,
+        )
+        assert moved.display_time == moved.datetime_local.strftime("%I:%M %p").lstrip("0")
+
+
+def test_event_index_selection_matches_filter_helpers():
+    rng = random.Random(7)
+    titles = ["CPI y/y", "Core CPI m/m", "GDP q/q", "Bank Holiday", "PMI", "Rate Decision"]
+    payload = [
+        {
+            "date": f"2025-10-{day:02d}T{hour:02d}:{minute:02d}:00Z",
+            "impact": rng.choice(["High", "Medium", "Low", "Holiday"]),
+            "country": rng.choice(["USD", "EUR", "GBP", "JPY"]),
+            "title": rng.choice(titles),
+        }
+        for day, hour, minute in (
+            (rng.randint(1, 7), rng.randint(0, 23), rng.randrange(0, 60, 15))
+            for _ in range(80)
+        )
+    ]
+    rng.shuffle(payload)
+    events = sort_events(build_events(payload), by_impact_first=False)
+    index = build_event_index(events)
+    local_days = sorted({event.datetime_local.date() for event in events})
+
+    impact_choices = [None, [ImpactLevel.HIGH], [ImpactLevel.MEDIUM, ImpactLevel.HOLIDAY]]
+    currency_choices = [(), ("usd",), ("EUR", "JPY")]
+    date_choices = [(None, None), (local_days[1], None), (None, local_days[3]),
+                    (local_days[2], local_days[4]), (local_days[5], local_days[1])]
+    # Queries grow and then shrink so incremental narrowing is exercised both ways.
+    queries = ["", "c", "cp", "cpi", "cpi ", "cp", "", "p", "pm", "x", ""]
+
+    for impacts in impact_choices:
+        for currencies in currency_choices:
+            for start, end in date_choices:
+                previous = None
+                for query in queries:
+                    matches = None
+                    if query:
+                        matches = search_event_indexes(index, query, previous)
+                        previous = (query, matches)
+                    positions = select_event_indexes(
+                        index,
+                        impacts=impacts,
+                        currencies=currencies,
+                        start=start,
+                        end=end,
+                        search_matches=matches,
+                    )
+
+                    expected = events
+                    if impacts is not None:
+                        expected = filter_by_impact(expected, impacts)
+                    if currencies:
+                        expected = filter_by_currency(expected, currencies)
+                    expected = filter_by_date_range(expected, start, end)
+                    expected = search_events(expected, query)
+                    assert [events[position] for position in positions] == expected